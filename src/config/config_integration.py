@@ -31,16 +31,19 @@ class WhisperEngineConfigIntegrator:
             if not load_environment():
                 pass
 
-            # Apply adaptive configuration environment variables
-            for key, value in self.env_vars.items():
-                os.environ[key] = value
-
-            # Set deployment-specific variables
-            os.environ["WHISPERENGINE_DEPLOYMENT_MODE"] = self.deployment_info["deployment_mode"]
-            os.environ["WHISPERENGINE_SCALE_TIER"] = str(self.deployment_info["scale_tier"])
-            os.environ["WHISPERENGINE_PLATFORM"] = self.deployment_info["platform"]
-            os.environ["WHISPERENGINE_CPU_CORES"] = str(self.deployment_info["cpu_cores"])
-            os.environ["WHISPERENGINE_MEMORY_GB"] = str(round(self.deployment_info["memory_gb"], 1))
+            # Adaptive configuration variables plus deployment-specific variables,
+            # applied in a single update
+            new_vars = dict(self.env_vars)
+            new_vars.update(
+                {
+                    "WHISPERENGINE_DEPLOYMENT_MODE": self.deployment_info["deployment_mode"],
+                    "WHISPERENGINE_SCALE_TIER": str(self.deployment_info["scale_tier"]),
+                    "WHISPERENGINE_PLATFORM": self.deployment_info["platform"],
+                    "WHISPERENGINE_CPU_CORES": str(self.deployment_info["cpu_cores"]),
+                    "WHISPERENGINE_MEMORY_GB": str(round(self.deployment_info["memory_gb"], 1)),
+                }
+            )
+            os.environ.update(new_vars)
 
             return True
         except Exception:
@@ -17,6 +17,14 @@ from urllib3.util.retry import Retry
 from src.utils.exceptions import LLMConnectionError, LLMError, LLMRateLimitError, LLMTimeoutError
 from src.utils.performance_monitor import monitor_performance
 
+# System messages carrying per-turn context. They are emitted after the static
+# instructions so the combined system prompt keeps a stable prefix across turns.
+_VOLATILE_SYSTEM_CONTENT = re.compile(
+    r"\s*(?:current time|current date|time:|previous conversation summary|"
+    r"visual context|user (?:emotional )?context)",
+    re.IGNORECASE,
+)
+
 
 class LLMClient:
     """Generic client for connecting to various LLM services via HTTP API
@@ -409,11 +417,22 @@ class LLMClient:
             if not model_path:
                 # Try to find GGUF models in models directory
                 models_dir = os.getenv("LOCAL_MODELS_DIR", "./models")
-                import glob
 
-                gguf_files = glob.glob(os.path.join(models_dir, "*.gguf"))
-                if gguf_files:
-                    model_path = gguf_files[0]  # Use first GGUF file found
+                # Stop at the first GGUF file instead of listing the whole directory
+                try:
+                    with os.scandir(models_dir) as entries:
+                        model_path = next(
+                            (
+                                entry.path
+                                for entry in entries
+                                if entry.name.endswith(".gguf") and not entry.name.startswith(".")
+                            ),
+                            None,
+                        )
+                except OSError:
+                    model_path = None
+
+                if model_path:
                     self.logger.info(f"Auto-detected GGUF model: {model_path}")
                 else:
                     self.logger.warning(
@@ -432,18 +451,36 @@ class LLMClient:
             if os.getenv("LLAMACPP_USE_GPU", "auto").lower() == "true":
                 n_gpu_layers = -1  # Use all GPU layers
             elif os.getenv("LLAMACPP_USE_GPU", "auto").lower() == "auto":
-                # Auto-detect GPU support
-                try:
-                    import torch
-
-                    if torch.cuda.is_available():
-                        n_gpu_layers = -1
-                        self.logger.info("🔥 CUDA detected - enabling GPU acceleration")
-                    elif torch.backends.mps.is_available():
-                        n_gpu_layers = 1  # Use some GPU layers for MPS
-                        self.logger.info("🍎 MPS detected - enabling partial GPU acceleration")
-                except ImportError:
-                    pass  # No torch available, stay on CPU
+                # Auto-detect GPU support - ask llama.cpp itself when possible so we
+                # don't pay for a full torch import just to probe the hardware
+                import llama_cpp
+
+                supports_gpu_offload = getattr(llama_cpp, "llama_supports_gpu_offload", None)
+                if supports_gpu_offload is not None:
+                    if supports_gpu_offload():
+                        from src.llm.local_server_detector import is_macos
+
+                        if is_macos():
+                            # Metal build - keep the partial offload previously used for MPS
+                            n_gpu_layers = 1
+                            self.logger.info(
+                                "🍎 Metal offload supported - enabling partial GPU acceleration"
+                            )
+                        else:
+                            n_gpu_layers = -1
+                            self.logger.info("🔥 GPU offload supported - enabling GPU acceleration")
+                else:
+                    try:
+                        import torch
+
+                        if torch.cuda.is_available():
+                            n_gpu_layers = -1
+                            self.logger.info("🔥 CUDA detected - enabling GPU acceleration")
+                        elif torch.backends.mps.is_available():
+                            n_gpu_layers = 1  # Use some GPU layers for MPS
+                            self.logger.info("🍎 MPS detected - enabling partial GPU acceleration")
+                    except ImportError:
+                        pass  # No torch available, stay on CPU
 
             # Initialize llama-cpp-python model
             self.llamacpp_model = Llama(
@@ -1280,6 +1317,49 @@ class LLMClient:
             self.logger.error(f"Failed to get response from LLM: {e}")
             raise LLMError(f"Failed to get response from LLM: {str(e)}")
 
+    def _max_system_message_length(self) -> int:
+        """Character limit for the combined system message"""
+        # Calculate dynamic character limit based on token configuration
+        # Reserve 50% of max tokens for system message, convert tokens to characters with 4:1 ratio
+        max_tokens_for_system = self.default_max_tokens_chat // 2  # 50% allocation
+        calculated_char_limit = max_tokens_for_system * 4  # 4 characters per token approximation
+
+        # Allow environment override but use calculated limit as minimum
+        env_limit = int(os.getenv("MAX_SYSTEM_MESSAGE_LENGTH", str(calculated_char_limit)))
+        return max(calculated_char_limit, env_limit)
+
+    def _alternation_fast_path(self, messages: list) -> list | None:
+        """
+        Return the fixed message list for already well-formed input, or None.
+
+        Well-formed means an optional leading system message within the length
+        limit followed by non-empty text messages strictly alternating
+        user/assistant. Anything else needs the full filter and returns None.
+        """
+        start = 0
+        first = messages[0]
+        if first.get("role") == "system":
+            content = first.get("content")
+            if not isinstance(content, str) or not content:
+                return None
+            if len(content) > self._max_system_message_length():
+                return None
+            start = 1
+
+        expected_role = "user"
+        for index in range(start, len(messages)):
+            msg = messages[index]
+            if msg.get("role") != expected_role:
+                return None
+            content = msg.get("content", "")
+            if not isinstance(content, str) or not content.strip():
+                return None
+            expected_role = "assistant" if expected_role == "user" else "user"
+
+        if start:
+            return [{"role": "system", "content": first["content"]}, *messages[1:]]
+        return list(messages)
+
     def _fix_message_alternation(self, messages: list) -> list:
         """
         Ensure proper user/assistant alternation by filtering, not merging.
@@ -1289,12 +1369,21 @@ class LLMClient:
         Args:
             messages: List of message dictionaries with 'role' and 'content'
 
+        System messages are combined into one, static instructions first and
+        per-turn context (time, summaries, visual context) last, each group in
+        input order. The stable prefix lets LLM servers reuse prompt caches.
+
         Returns:
             Filtered list with proper role alternation (NO CONTENT MERGING)
         """
         if not messages:
             return messages
 
+        # Well-formed conversations need no filtering
+        fast_result = self._alternation_fast_path(messages)
+        if fast_result is not None:
+            return fast_result
+
         # SECURITY MODULE DISABLED: Let character prompts through unchanged
 
         result = []
@@ -1309,22 +1398,27 @@ class LLMClient:
 
         # SECURITY ENHANCEMENT: Limit combined system message size to prevent large exposure surface
         if system_messages:
-            combined_system_content = "\n\n".join(
-                msg.get("content", "") for msg in system_messages if msg.get("content")
-            )
-
-            # Calculate dynamic character limit based on token configuration
-            # Reserve 50% of max tokens for system message, convert tokens to characters with 4:1 ratio
-            import os
-
-            max_tokens_for_system = self.default_max_tokens_chat // 2  # 50% allocation
-            calculated_char_limit = (
-                max_tokens_for_system * 4
-            )  # 4 characters per token approximation
-
-            # Allow environment override but use calculated limit as minimum
-            env_limit = int(os.getenv("MAX_SYSTEM_MESSAGE_LENGTH", str(calculated_char_limit)))
-            MAX_SYSTEM_MESSAGE_LENGTH = max(calculated_char_limit, env_limit)
+            static_parts = []
+            volatile_parts = []
+            for msg in system_messages:
+                content = msg.get("content")
+                if not content:
+                    continue
+                if isinstance(content, str) and _VOLATILE_SYSTEM_CONTENT.match(content):
+                    volatile_parts.append(content)
+                else:
+                    static_parts.append(content)
+            MAX_SYSTEM_MESSAGE_LENGTH = self._max_system_message_length()
+
+            # Stop collecting parts once past the limit - the rest would be truncated anyway
+            combined_parts = []
+            combined_length = -2  # No separator before the first part
+            for part in static_parts + volatile_parts:
+                combined_parts.append(part)
+                combined_length += len(part) + 2
+                if combined_length > MAX_SYSTEM_MESSAGE_LENGTH:
+                    break
+            combined_system_content = "\n\n".join(combined_parts)
 
             if len(combined_system_content) > MAX_SYSTEM_MESSAGE_LENGTH:
                 combined_system_content = (
@@ -6,17 +6,55 @@ for seamless WhisperEngine integration.
 """
 
 import asyncio
+import contextlib
 import logging
+import os
 import platform
+import shutil
 import subprocess
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, replace
 from typing import Any
+from urllib.parse import urlsplit
 
 import aiohttp
 import psutil
 
 logger = logging.getLogger(__name__)
 
+# Platform facts don't change while the process runs - detect them once
+_PLATFORM_SYSTEM = platform.system()
+_PLATFORM_MACHINE = platform.machine()
+_IS_APPLE_SILICON = _PLATFORM_SYSTEM == "Darwin" and _PLATFORM_MACHINE == "arm64"
+
+# GPU detection result, filled on first use (it spawns nvidia-smi/system_profiler)
+_GPU_AVAILABLE: bool | None = None
+
+# Probe results keyed by probe URL -> (monotonic timestamp, ServerInfo).
+# Shared across detector instances so a quick series of detections
+# doesn't repeat the same HTTP round-trips. Only available servers are
+# cached - a starting or unreachable server is re-probed every time.
+_PROBE_CACHE: dict[str, tuple[float, "ServerInfo"]] = {}
+
+
+def is_macos() -> bool:
+    """Return whether this process runs on macOS (detected once at import)"""
+    return _PLATFORM_SYSTEM == "Darwin"
+
+
+async def _port_open(host: str, port: int, timeout: float = 0.25) -> bool:
+    """Check whether a TCP port accepts connections (cheaper than an HTTP request)"""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
 
 @dataclass
 class ServerInfo:
@@ -31,6 +69,11 @@ class ServerInfo:
     error_message: str | None = None
 
 
+def _copy_server_info(server_info: ServerInfo) -> ServerInfo:
+    """Return a copy of a ServerInfo that shares no mutable state with it"""
+    return replace(server_info, models=list(server_info.models))
+
+
 @dataclass
 class SetupRecommendation:
     """Recommended setup based on system resources"""
@@ -61,7 +104,9 @@ class LocalLLMDetector:
     """Automatically detect and configure local LLM servers"""
 
     def __init__(self):
-        self.timeout = 5.0  # Connection timeout in seconds
+        # Total HTTP probe timeout in seconds - a healthy localhost server answers in
+        # milliseconds, and closed ports are already rejected by the TCP pre-check
+        self.timeout = float(os.getenv("LOCAL_LLM_PROBE_TIMEOUT", "1.0"))
         self.detected_servers = {}
 
     async def detect_available_servers(self) -> dict[str, ServerInfo]:
@@ -90,17 +135,46 @@ class LocalLLMDetector:
             },
         ]
 
-        # Test each server configuration
-        for config in server_configs:
-            logger.debug(f"Testing {config['name']} at {config['url']}")
-            server_info = await self._test_server(config)
+        # One pooled session for all probes instead of a new connector per server
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as session:
+            # Test all server configurations concurrently - each probe is I/O bound,
+            # so total detection time is bounded by the slowest probe, not the sum
+            results = await asyncio.gather(
+                *(self._test_server(config, session) for config in server_configs)
+            )
+
+        for config, server_info in zip(server_configs, results):
             servers[config["name"].lower().replace(" ", "_")] = server_info
 
         self.detected_servers = servers
         return servers
 
-    async def _test_server(self, config: dict[str, Any]) -> ServerInfo:
-        """Test if a specific server is available and get its models"""
+    async def _test_server(
+        self, config: dict[str, Any], session: aiohttp.ClientSession | None = None
+    ) -> ServerInfo:
+        """Test if a specific server is available, reusing recent probe results"""
+        logger.debug(f"Testing {config['name']} at {config['url']}")
+        cache_key = f"{config['url']}{config.get('health_endpoint', '/models')}"
+        ttl = float(os.getenv("WHISPERENGINE_BACKEND_PROBE_TTL", "10"))
+
+        cached = _PROBE_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            logger.debug(f"Using cached probe result for {config['name']}")
+            return _copy_server_info(cached[1])
+
+        server_info = await self._probe_server(config, session)
+        if ttl > 0 and server_info.status == "available":
+            _PROBE_CACHE[cache_key] = (time.monotonic(), _copy_server_info(server_info))
+        else:
+            _PROBE_CACHE.pop(cache_key, None)
+        return server_info
+
+    async def _probe_server(
+        self, config: dict[str, Any], session: aiohttp.ClientSession | None = None
+    ) -> ServerInfo:
+        """Probe a specific server over HTTP and get its models"""
         name = config["name"]
         url = config["url"]
         health_endpoint = config.get("health_endpoint", "/models")
@@ -109,10 +183,19 @@ class LocalLLMDetector:
             # First check if process is running
             process_running = self._is_process_running(config.get("process_names", []))
 
-            # Test HTTP connection
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            ) as session:
+            # Closed ports refuse immediately - skip the HTTP client entirely
+            parts = urlsplit(url)
+            if not await _port_open(parts.hostname or "localhost", parts.port or 80):
+                logger.debug(f"❌ {name} port not open")
+                return self._connection_failed(name, url, process_running, "port not open")
+
+            # Test HTTP connection, reusing the caller's session when one is given
+            session_context = (
+                contextlib.nullcontext(session)
+                if session is not None
+                else aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+            )
+            async with session_context as session:
                 try:
                     async with session.get(f"{url}{health_endpoint}") as response:
                         if response.status == 200:
@@ -150,26 +233,7 @@ class LocalLLMDetector:
 
                 except aiohttp.ClientError as e:
                     logger.debug(f"❌ {name} connection failed: {e}")
-
-                    # If process is running but HTTP fails, it might be starting up
-                    if process_running:
-                        return ServerInfo(
-                            name=name,
-                            url=url,
-                            status="starting",
-                            models=[],
-                            setup_required=True,
-                            error_message="Process running but HTTP not responding (may be starting up)",
-                        )
-                    else:
-                        return ServerInfo(
-                            name=name,
-                            url=url,
-                            status="unreachable",
-                            models=[],
-                            setup_required=True,
-                            error_message=f"Connection failed: {str(e)}",
-                        )
+                    return self._connection_failed(name, url, process_running, str(e))
 
         except Exception as e:
             logger.debug(f"❌ {name} detection error: {e}")
@@ -182,6 +246,29 @@ class LocalLLMDetector:
                 error_message=f"Detection error: {str(e)}",
             )
 
+    def _connection_failed(
+        self, name: str, url: str, process_running: bool, error: str
+    ) -> ServerInfo:
+        """Build the ServerInfo for a server that could not be reached"""
+        # If process is running but HTTP fails, it might be starting up
+        if process_running:
+            return ServerInfo(
+                name=name,
+                url=url,
+                status="starting",
+                models=[],
+                setup_required=True,
+                error_message="Process running but HTTP not responding (may be starting up)",
+            )
+        return ServerInfo(
+            name=name,
+            url=url,
+            status="unreachable",
+            models=[],
+            setup_required=True,
+            error_message=f"Connection failed: {error}",
+        )
+
     def _is_process_running(self, process_names: list[str]) -> bool:
         """Check if any of the given process names are running"""
         try:
@@ -242,11 +329,11 @@ class LocalLLMDetector:
             memory_gb = psutil.virtual_memory().total / (1024**3)
             cpu_cores = psutil.cpu_count(logical=True) or 4  # Default to 4 if None
             gpu_available = self._detect_gpu()
-            platform_name = platform.system()
-            architecture = platform.machine()
+            platform_name = _PLATFORM_SYSTEM
+            architecture = _PLATFORM_MACHINE
 
             # Check for Apple Silicon
-            apple_silicon = platform_name == "Darwin" and architecture == "arm64"
+            apple_silicon = _IS_APPLE_SILICON
 
             # Check MLX availability
             mlx_available = self._detect_mlx_availability()
@@ -279,7 +366,7 @@ class LocalLLMDetector:
         return False
         # try:
         #     # Only available on Apple Silicon
-        #     if platform.system() != "Darwin" or platform.machine() != "arm64":
+        #     if not _IS_APPLE_SILICON:
         #         return False
         # 
         #     # Try to import MLX
@@ -291,18 +378,27 @@ class LocalLLMDetector:
         #     return False
 
     def _detect_gpu(self) -> bool:
-        """Detect GPU availability"""
+        """Detect GPU availability (detected once per process)"""
+        global _GPU_AVAILABLE
+        if _GPU_AVAILABLE is None:
+            _GPU_AVAILABLE = self._probe_gpu()
+        return _GPU_AVAILABLE
+
+    def _probe_gpu(self) -> bool:
+        """Probe GPU tooling for an NVIDIA or Apple Silicon GPU"""
         try:
-            # Check for NVIDIA GPU
-            result = subprocess.run(["nvidia-smi"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                return True
+            # Check for NVIDIA GPU - a PATH lookup is far cheaper than spawning a
+            # process that doesn't exist
+            if shutil.which("nvidia-smi"):
+                result = subprocess.run(["nvidia-smi"], capture_output=True, text=True, timeout=5)
+                if result.returncode == 0:
+                    return True
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
 
         try:
             # Check for Apple Metal on macOS
-            if platform.system() == "Darwin":
+            if is_macos():
                 result = subprocess.run(
                     ["system_profiler", "SPDisplaysDataType"],
                     capture_output=True,
@@ -5,18 +5,19 @@ Only supports remote API backends - no local model loading.
 
 import os
 import logging
+import threading
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BackendInfo:
-    """Information about an available LLM backend"""
+    """Information about an available LLM backend (immutable, hashable)"""
     name: str
     priority: int
     url_scheme: str
     description: str
-    requirements: List[str]
+    requirements: Tuple[str, ...]
     platform_optimized: bool = False
     gpu_accelerated: bool = False
     apple_silicon_optimized: bool = False
@@ -30,9 +31,22 @@ class SmartBackendSelector:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.available_backends = self._detect_available_backends()
+        self._optimal_cache: Dict[Tuple[bool, bool], Optional[BackendInfo]] = {}
+        self._status_cache: Optional[Dict[str, dict]] = None
+
+    def refresh(self) -> None:
+        """Re-run backend detection (e.g. after API keys change)"""
+        self.available_backends = self._detect_available_backends()
+        self._optimal_cache.clear()
+        self._status_cache = None
 
     def get_available_backends(self) -> List[BackendInfo]:
         """Get list of available backends (remote APIs only)"""
+        return list(self.available_backends)
+
+    def _detect_available_backends(self) -> List[BackendInfo]:
+        """Detect configured remote API backends"""
         backends = []
 
         # Priority 1: OpenAI API (Primary choice)
@@ -43,7 +57,7 @@ class SmartBackendSelector:
                     priority=1,
                     url_scheme="https://api.openai.com",
                     description="OpenAI API with GPT models",
-                    requirements=["OPENAI_API_KEY"],
+                    requirements=("OPENAI_API_KEY",),
                     platform_optimized=True,
                     gpu_accelerated=True,
                 )
@@ -57,31 +71,40 @@ class SmartBackendSelector:
                     priority=2,
                     url_scheme="https://api.anthropic.com",
                     description="Anthropic Claude API",
-                    requirements=["ANTHROPIC_API_KEY"],
+                    requirements=("ANTHROPIC_API_KEY",),
                     platform_optimized=True,
                     gpu_accelerated=True,
                 )
             )
 
-        # Additional remote API endpoints can be added here
+        # Additional remote API endpoints can be added here (in priority order)
         # No local model backends - WhisperEngine uses remote APIs only
 
-        return sorted(backends, key=lambda x: x.priority)
+        # Backends are appended in ascending priority, so no sort is needed
+        return backends
 
     def get_optimal_backend(
         self, prefer_local: bool = False, require_gpu: bool = False
     ) -> Optional[BackendInfo]:
         """Get the optimal backend (remote APIs only)"""
-        
-        candidates = self.get_available_backends()
-        
+        cache_key = (prefer_local, require_gpu)
+        if cache_key in self._optimal_cache:
+            optimal = self._optimal_cache[cache_key]
+            if optimal is not None:
+                self.logger.debug(f"🌐 Using selected remote API backend: {optimal.name}")
+            return optimal
+
+        candidates = self.available_backends
+
         if not candidates:
             self.logger.error("❌ No LLM backends available - check API keys")
-            return None
+            optimal = None
+        else:
+            # Since we only use remote APIs, just return the highest priority
+            optimal = candidates[0]
+            self.logger.info(f"🌐 Selected remote API backend: {optimal.name}")
 
-        # Since we only use remote APIs, just return the highest priority
-        optimal = candidates[0]
-        self.logger.info(f"🌐 Selected remote API backend: {optimal.name}")
+        self._optimal_cache[cache_key] = optimal
         return optimal
 
     def validate_backend(self, backend: BackendInfo) -> bool:
@@ -94,16 +117,36 @@ class SmartBackendSelector:
         return False
 
     def get_backend_status(self) -> dict:
-        """Get status of all backends"""
-        backends = self.get_available_backends()
-        status = {}
-        
-        for backend in backends:
-            status[backend.name] = {
-                "available": True,
-                "configured": self.validate_backend(backend),
-                "type": "remote_api",
-                "requirements_met": self.validate_backend(backend)
-            }
-        
-        return status
\ No newline at end of file
+        """Get status of all backends (computed once per detection, see refresh())"""
+        if self._status_cache is None:
+            status = {}
+
+            for backend in self.available_backends:
+                # Both fields come from the same env lookup - read it once
+                configured = self.validate_backend(backend)
+                status[backend.name] = {
+                    "available": True,
+                    "configured": configured,
+                    "type": "remote_api",
+                    "requirements_met": configured,
+                }
+
+            self._status_cache = status
+
+        # Hand out copies so callers can't mutate the cached entries
+        return {name: dict(entry) for name, entry in self._status_cache.items()}
+
+
+# Global instance shared by callers that only need the detected backends
+_smart_backend_selector = None
+_smart_backend_selector_lock = threading.Lock()
+
+
+def get_smart_backend_selector() -> SmartBackendSelector:
+    """Get or create the global backend selector instance"""
+    global _smart_backend_selector
+    if _smart_backend_selector is None:
+        with _smart_backend_selector_lock:
+            if _smart_backend_selector is None:
+                _smart_backend_selector = SmartBackendSelector()
+    return _smart_backend_selector
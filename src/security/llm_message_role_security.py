@@ -7,14 +7,78 @@ This module provides secure role validation, system message processing,
 and protection against role-based attacks in LLM interactions.
 """
 
+import hashlib
+import json
 import logging
 import os
 import re
+from collections import OrderedDict
+from dataclasses import dataclass, fields, replace
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Comprehensive patterns for detecting various injection attacks. Fixed for the
+# life of the process: scan results are cached per content, so the patterns
+# are tuples rather than lists that could be changed at runtime
+DANGEROUS_PATTERNS: tuple[str, ...] = (
+    r"ignore\s+previous\s+instructions",
+    r"forget\s+your\s+role",
+    r"you\s+are\s+now\s+a\s+different",
+    r"system\s*:\s*override",
+    r"new\s+system\s+prompt",
+    r"disregard\s+above",
+    r"act\s+as\s+if\s+you\s+are",
+    r"pretend\s+to\s+be",
+    r"\\n\\n---\\n\\nignore",
+    r"</system>.*<system>",  # XML-style injection
+    r"```system.*```",  # Code block injection
+    r"malicious\s*:\s*override",  # Test pattern
+    r"override\s+all\s+instructions",  # Test pattern
+)
+
+# Each pattern compiled once, paired with its source string for reporting
+_COMPILED_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (pattern, re.compile(pattern, re.IGNORECASE | re.MULTILINE)) for pattern in DANGEROUS_PATTERNS
+)
+
+
+# Shortest text any dangerous pattern can match ("```system```"); anything
+# shorter is clean without running a regex. Update this when adding a pattern
+# with a shorter match - the unit tests check each pattern's shortest match
+_MIN_INJECTION_LENGTH = 12
+
+# Oversized system messages are sanitized in a window this far past the length
+# limit, so phrases straddling the cut are still filtered before truncation
+_SANITIZE_WINDOW_SLACK = 1024
+
+# Repeated content (canned system prefixes, common replies) is scanned once per
+# process; longer content bypasses the cache to keep its memory bounded
+_SCAN_CACHE_MAX_CONTENT_LENGTH = 2048
+
+
+@lru_cache(maxsize=1024)
+def _scan_content(content: str) -> tuple[str, ...]:
+    """Return the dangerous patterns found in content (pure, cacheable)"""
+    # Patterns are compiled case-insensitive, so no lowercased copy is needed
+    if len(content) < _MIN_INJECTION_LENGTH:
+        return ()
+
+    return tuple(pattern for pattern, compiled in _COMPILED_PATTERNS if compiled.search(content))
+
+
+_EXCESSIVE_NEWLINES = re.compile(r"\n{4,}")
+_ROLE_REFERENCE = re.compile(r'(role\s*[:=]\s*["\']?(system|user|assistant)["\']?)', re.IGNORECASE)
+
 
 class MessageRole(Enum):
     """Enumeration of valid message roles"""
@@ -24,6 +88,9 @@ class MessageRole(Enum):
     ASSISTANT = "assistant"
 
 
+_VALID_ROLES = frozenset(role.value for role in MessageRole)
+
+
 class SecurityThreat(Enum):
     """Types of security threats in message processing"""
 
@@ -33,6 +100,37 @@ class SecurityThreat(Enum):
     MALFORMED_MESSAGE = "malformed_message"
 
 
+@dataclass(slots=True)
+class SecurityEvent:
+    """
+    A recorded security event
+
+    Slotted with one optional field per event detail, so processors that keep
+    long event histories don't pay for a dict per event.
+    """
+
+    type: str
+    threats: list[str] | None = None
+    content_preview: str | None = None
+    filtered_count: int | None = None
+    candidates_count: int | None = None
+    selected_priority: float | None = None
+    selected_length: int | None = None
+    discarded_count: int | None = None
+
+    def copy(self) -> "SecurityEvent":
+        """Return an independent copy of the event"""
+        return replace(self, threats=None if self.threats is None else list(self.threats))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the event as a dict containing only the fields that are set"""
+        return {
+            field.name: value
+            for field in fields(self)
+            if (value := getattr(self, field.name)) is not None
+        }
+
+
 class LLMMessageRoleSecurityProcessor:
     """
     Secure processor for LLM message roles with comprehensive security controls
@@ -43,6 +141,7 @@ class LLMMessageRoleSecurityProcessor:
         max_system_length: int | None = None,
         max_messages: int = 50,
         security_log_level: str = "normal",
+        cache_results: bool = False,
     ):
         """
         Initialize the security processor
@@ -51,6 +150,9 @@ class LLMMessageRoleSecurityProcessor:
             max_system_length: Maximum allowed system message length
             max_messages: Maximum number of messages to process
             security_log_level: Logging verbosity - "quiet", "normal", or "verbose"
+            cache_results: Reuse results for repeated identical message lists. Each
+                call then pays for serializing and hashing its input, so only enable
+                it where identical lists recur (e.g. retried requests)
         """
         self.security_log_level = security_log_level.lower()
         # Set max_system_length from parameter, environment variable, or calculate from token limits
@@ -71,35 +173,29 @@ class LLMMessageRoleSecurityProcessor:
                 self.max_system_length = max(self.max_system_length, 16000)
 
         self.max_messages = max_messages
-        self.security_events = []
+        self.security_events: list[SecurityEvent] = []
+
+        # Opt-in exact-match cache of processed message lists:
+        # key -> (result, events recorded)
+        self.cache_results = cache_results
+        self.processing_cache_size = 64
+        self._processing_cache: OrderedDict[
+            str, tuple[list[dict[str, Any]], list[SecurityEvent]]
+        ] = OrderedDict()
 
         # Log the configured limits for debugging
         logger.debug(
             f"LLM Message Security initialized: max_system_length={self.max_system_length} characters, max_messages={self.max_messages}"
         )
 
-        # Comprehensive patterns for detecting various injection attacks
-        self.dangerous_patterns = [
-            r"ignore\s+previous\s+instructions",
-            r"forget\s+your\s+role",
-            r"you\s+are\s+now\s+a\s+different",
-            r"system\s*:\s*override",
-            r"new\s+system\s+prompt",
-            r"disregard\s+above",
-            r"act\s+as\s+if\s+you\s+are",
-            r"pretend\s+to\s+be",
-            r"\\n\\n---\\n\\nignore",
-            r"</system>.*<system>",  # XML-style injection
-            r"```system.*```",  # Code block injection
-            r"malicious\s*:\s*override",  # Test pattern
-            r"override\s+all\s+instructions",  # Test pattern
-        ]
+        # Read-only views of the module patterns, which scanning and
+        # sanitization both use directly
+        self.dangerous_patterns = DANGEROUS_PATTERNS
+        self.compiled_patterns = _COMPILED_PATTERNS
 
         logger.info("LLM Message Role Security Processor initialized")
 
-    def validate_message_structure(
-        self, message: dict[str, Any]
-    ) -> tuple[bool, SecurityThreat | None]:
+    def validate_message_structure(self, message: Any) -> tuple[bool, SecurityThreat | None]:
         """
         Validate the basic structure of a message
 
@@ -112,18 +208,14 @@ class LLMMessageRoleSecurityProcessor:
         if not isinstance(message, dict):
             return False, SecurityThreat.MALFORMED_MESSAGE
 
-        if "role" not in message:
-            return False, SecurityThreat.MALFORMED_MESSAGE
-
-        if "content" not in message:
-            return False, SecurityThreat.MALFORMED_MESSAGE
-
-        role = message.get("role")
-        if role not in [r.value for r in MessageRole]:
-            logger.warning(f"Invalid message role detected: {role}")
-            return False, SecurityThreat.ROLE_CONFUSION
-
-        return True, None
+        match message:
+            case {"role": str() as role, "content": _} if role in _VALID_ROLES:
+                return True, None
+            case {"role": role, "content": _}:
+                logger.warning(f"Invalid message role detected: {role}")
+                return False, SecurityThreat.ROLE_CONFUSION
+            case _:
+                return False, SecurityThreat.MALFORMED_MESSAGE
 
     def scan_for_injection_attempts(self, content: str) -> list[str]:
         """
@@ -135,16 +227,16 @@ class LLMMessageRoleSecurityProcessor:
         Returns:
             List of detected dangerous patterns
         """
-        detected_patterns = []
-
-        content_lower = content.lower()
+        if len(content) <= _SCAN_CACHE_MAX_CONTENT_LENGTH:
+            detected_patterns = _scan_content(content)
+        else:
+            # Don't pin very long strings in the cache
+            detected_patterns = _scan_content.__wrapped__(content)
 
-        for pattern in self.dangerous_patterns:
-            if re.search(pattern, content_lower, re.IGNORECASE | re.MULTILINE):
-                detected_patterns.append(pattern)
-                logger.warning(f"Detected potential injection pattern: {pattern}")
+        for pattern in detected_patterns:
+            logger.warning(f"Detected potential injection pattern: {pattern}")
 
-        return detected_patterns
+        return list(detected_patterns)
 
     def sanitize_system_message_content(self, content: str) -> str:
         """
@@ -156,30 +248,35 @@ class LLMMessageRoleSecurityProcessor:
         Returns:
             Sanitized content
         """
-        sanitized = content
-
-        # Remove potential injection attempts
-        for pattern in self.dangerous_patterns:
-            sanitized = re.sub(
-                pattern, "[SECURITY_FILTERED]", sanitized, flags=re.IGNORECASE | re.MULTILINE
+        # Only sanitize a bounded window of oversized messages - text well past
+        # the limit would be truncated away anyway
+        original_length = len(content)
+        sanitized = content[: self.max_system_length + _SANITIZE_WINDOW_SLACK]
+        window_cut = len(sanitized) < original_length
+
+        # Remove potential injection attempts; the subn counts say whether
+        # anything was filtered without a second scan
+        filtered_count = 0
+        for _, compiled in _COMPILED_PATTERNS:
+            sanitized, count = compiled.subn("[SECURITY_FILTERED]", sanitized)
+            filtered_count += count
+        if filtered_count:
+            logger.warning(f"Filtered {filtered_count} injection attempts from system message")
+            self.security_events.append(
+                SecurityEvent(type="system_injection_filtered", filtered_count=filtered_count)
             )
 
         # Remove excessive newlines that might be used for injection
-        sanitized = re.sub(r"\n{4,}", "\n\n\n", sanitized)
+        sanitized = _EXCESSIVE_NEWLINES.sub("\n\n\n", sanitized)
 
         # Remove potential role switching attempts
-        sanitized = re.sub(
-            r'(role\s*[:=]\s*["\']?(system|user|assistant)["\']?)',
-            "[ROLE_REFERENCE_FILTERED]",
-            sanitized,
-            flags=re.IGNORECASE,
-        )
+        sanitized = _ROLE_REFERENCE.sub("[ROLE_REFERENCE_FILTERED]", sanitized)
 
         # Limit length to prevent excessive system context
-        if len(sanitized) > self.max_system_length:
+        if window_cut or len(sanitized) > self.max_system_length:
             sanitized = sanitized[: self.max_system_length] + "\n[TRUNCATED_FOR_SECURITY]"
             logger.warning(
-                f"System message truncated to {self.max_system_length:,} characters (was {len(sanitized):,} chars). "
+                f"System message truncated to {self.max_system_length:,} characters (was {original_length:,} chars). "
                 f"Consider increasing MAX_SYSTEM_MESSAGE_LENGTH or reducing system prompt size."
             )
 
@@ -202,17 +299,21 @@ class LLMMessageRoleSecurityProcessor:
         sanitized = content
 
         if threats:
-            logger.warning(f"User message contains {len(threats)} potential injection attempts")
-            self.security_events.append(
-                {
-                    "type": "user_injection_attempt",
-                    "threats": threats,
-                    "content_preview": content[:100] + "..." if len(content) > 100 else content,
-                }
-            )
+            self._record_user_injection_attempt(content, threats)
 
         return sanitized, threats
 
+    def _record_user_injection_attempt(self, content: str, threats: list[str]) -> None:
+        """Log and record a user message that matched dangerous patterns"""
+        logger.warning(f"User message contains {len(threats)} potential injection attempts")
+        self.security_events.append(
+            SecurityEvent(
+                type="user_injection_attempt",
+                threats=list(threats),
+                content_preview=content[:100] + "..." if len(content) > 100 else content,
+            )
+        )
+
     def process_system_messages_securely(
         self, system_messages: list[dict[str, Any]]
     ) -> dict[str, Any] | None:
@@ -233,7 +334,7 @@ class LLMMessageRoleSecurityProcessor:
             return None
 
         # SECURITY ENHANCEMENT: Process and rank system messages by priority
-        valid_candidates = []
+        valid_candidates: list[dict[str, Any]] = []
 
         for msg in system_messages:
             is_valid, threat = self.validate_message_structure(msg)
@@ -275,13 +376,13 @@ class LLMMessageRoleSecurityProcessor:
 
         # Log security event about system message selection
         self.security_events.append(
-            {
-                "type": "system_message_selection",
-                "candidates_count": len(valid_candidates),
-                "selected_priority": selected_message["priority"],
-                "selected_length": len(final_content),
-                "discarded_count": len(valid_candidates) - 1,
-            }
+            SecurityEvent(
+                type="system_message_selection",
+                candidates_count=len(valid_candidates),
+                selected_priority=selected_message["priority"],
+                selected_length=len(final_content),
+                discarded_count=len(valid_candidates) - 1,
+            )
         )
 
         logger.info(
@@ -414,7 +515,19 @@ class LLMMessageRoleSecurityProcessor:
             logger.warning(f"Message list truncated from {len(messages)} to {self.max_messages}")
             messages = messages[-self.max_messages :]  # Keep most recent messages
 
-        validated_messages = []
+        # Loop-invariant values resolved once rather than per message
+        user_role = MessageRole.USER.value
+        assistant_role = MessageRole.ASSISTANT.value
+        # Use more generous limit for assistant responses - 100% allocation for
+        # responses, 4 chars per token
+        max_tokens_chat = int(os.getenv("LLM_MAX_TOKENS_CHAT", "8192"))
+        max_assistant_length = max_tokens_chat * 4 // 4
+
+        # Repeated user content ("Hello", "Thanks") is scanned once per call
+        user_threats: dict[str, list[str]] = {}
+
+        validated_messages: list[dict[str, Any]] = []
+        append_validated = validated_messages.append
         last_role = None
 
         for msg in messages:
@@ -423,27 +536,27 @@ class LLMMessageRoleSecurityProcessor:
                 logger.warning(f"Skipping invalid message: {threat}")
                 continue
 
-            role = msg.get("role")
-            content = str(msg.get("content", ""))
+            role = msg["role"]
+            content = str(msg["content"])
 
             # Skip empty messages
             if not content.strip():
                 continue
 
             # Apply role-specific validation
-            if role == MessageRole.USER.value:
-                sanitized_content, threats = self.validate_user_message_content(content)
-                if threats:
-                    # Log but generally allow user messages (with warnings)
-                    pass
-            elif role == MessageRole.ASSISTANT.value:
+            if role == user_role:
+                # Log but generally allow user messages (with warnings)
+                if content in user_threats:
+                    sanitized_content = content
+                    if user_threats[content]:
+                        self._record_user_injection_attempt(content, user_threats[content])
+                else:
+                    sanitized_content, user_threats[content] = self.validate_user_message_content(
+                        content
+                    )
+            elif role == assistant_role:
                 # Basic sanitization for assistant messages
                 sanitized_content = content
-                # Use more generous limit for assistant responses - 25% of max tokens as characters
-                max_tokens_chat = int(os.getenv("LLM_MAX_TOKENS_CHAT", "8192"))
-                max_assistant_length = (
-                    max_tokens_chat * 4 // 4
-                )  # 100% allocation for responses, 4 chars per token
                 if len(sanitized_content) > max_assistant_length:
                     sanitized_content = (
                         sanitized_content[:max_assistant_length] + "\n[RESPONSE_TRUNCATED]"
@@ -453,12 +566,12 @@ class LLMMessageRoleSecurityProcessor:
                 logger.warning(f"Unexpected system message in sequence: {content[:100]}...")
                 continue
 
-            # Ensure proper alternation (basic check)
-            if last_role == role and role in [MessageRole.USER.value, MessageRole.ASSISTANT.value]:
+            # Ensure proper alternation (basic check) - only user/assistant reach here
+            if last_role == role:
                 logger.debug(f"Role sequence issue: consecutive {role} messages")
                 # Could implement more sophisticated fixing here
 
-            validated_messages.append({"role": role, "content": sanitized_content})
+            append_validated({"role": role, "content": sanitized_content})
 
             last_role = role
 
@@ -477,11 +590,27 @@ class LLMMessageRoleSecurityProcessor:
         if not messages:
             return []
 
+        # Processing is deterministic, so identical input (e.g. a retried request)
+        # can reuse the previous result and replay its security events
+        cache_key = self._processing_cache_key(messages) if self.cache_results else None
+        cached = self._processing_cache.get(cache_key) if cache_key is not None else None
+        if cache_key is not None and cached is not None:
+            self._processing_cache.move_to_end(cache_key)
+            cached_messages, cached_events = cached
+            for event in cached_events:
+                if event.type != "system_message_selection":
+                    logger.warning(f"Repeated input with security event: {event.to_dict()}")
+                self.security_events.append(event.copy())
+            logger.debug(f"Reusing secure processing result for {len(messages)} messages")
+            return [dict(msg) for msg in cached_messages]
+
+        events_before = len(self.security_events)
+
         logger.debug(f"Processing {len(messages)} messages for security")
 
         # Separate system messages from conversation messages
-        system_messages = []
-        conversation_messages = []
+        system_messages: list[dict[str, Any]] = []
+        conversation_messages: list[dict[str, Any]] = []
 
         for msg in messages:
             is_valid, threat = self.validate_message_structure(msg)
@@ -495,7 +624,7 @@ class LLMMessageRoleSecurityProcessor:
                 conversation_messages.append(msg)
 
         # Process system messages securely
-        final_messages = []
+        final_messages: list[dict[str, Any]] = []
 
         if system_messages:
             combined_system = self.process_system_messages_securely(system_messages)
@@ -528,8 +657,45 @@ class LLMMessageRoleSecurityProcessor:
                 else:
                     logger.debug(f"Security events: {len(self.security_events)}")
 
+        if cache_key:
+            self._processing_cache[cache_key] = (
+                [dict(msg) for msg in final_messages],
+                [event.copy() for event in self.security_events[events_before:]],
+            )
+            if len(self._processing_cache) > self.processing_cache_size:
+                self._processing_cache.popitem(last=False)
+
         return final_messages
 
+    def _processing_cache_key(self, messages: list[dict[str, Any]]) -> str | None:
+        """
+        Build an exact-match cache key for a message list
+
+        Args:
+            messages: Raw messages to process
+
+        Returns:
+            SHA-256 hex digest, or None if the messages can't be serialized
+        """
+        # Everything the result depends on besides the messages: the processor's
+        # limits (mutable attributes) and the assistant length limit, which is
+        # read from the environment per call
+        payload = [
+            self.max_messages,
+            self.max_system_length,
+            self.security_log_level,
+            os.getenv("LLM_MAX_TOKENS_CHAT", "8192"),
+            messages,
+        ]
+        try:
+            if ORJSON_AVAILABLE:
+                serialized = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+            else:
+                serialized = json.dumps(payload, sort_keys=True).encode("utf-8")
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(serialized).hexdigest()
+
     def get_security_report(self) -> dict[str, Any]:
         """
         Get a report of security events and processing statistics
@@ -539,7 +705,7 @@ class LLMMessageRoleSecurityProcessor:
         """
         return {
             "total_security_events": len(self.security_events),
-            "events": self.security_events[-10:],  # Last 10 events
+            "events": [event.to_dict() for event in self.security_events[-10:]],  # Last 10 events
             "configuration": {
                 "max_system_length": self.max_system_length,
                 "max_messages": self.max_messages,
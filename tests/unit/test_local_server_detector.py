@@ -0,0 +1,97 @@
+"""
+Unit tests for local LLM server detection.
+
+Covers the shared probe cache and the once-per-process GPU detection.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import src.llm.local_server_detector as detector_module
+from src.llm.local_server_detector import LocalLLMDetector, ServerInfo
+
+CONFIG = {"name": "LM Studio", "url": "http://localhost:1234/v1", "health_endpoint": "/models"}
+
+
+@pytest.fixture
+def empty_probe_cache():
+    """Give each test its own probe cache."""
+    with patch.object(detector_module, "_PROBE_CACHE", {}):
+        yield
+
+
+def probe(detector, server_info):
+    """Run _test_server with _probe_server returning a copy of server_info."""
+    probe_server = AsyncMock(
+        side_effect=lambda *args: detector_module._copy_server_info(server_info)
+    )
+    with patch.object(detector, "_probe_server", probe_server):
+        result = asyncio.run(detector._test_server(CONFIG))
+    return result, probe_server.await_count
+
+
+def server(status, models=()):
+    """Build a ServerInfo with the given status."""
+    return ServerInfo(name="LM Studio", url=CONFIG["url"], status=status, models=list(models))
+
+
+class TestProbeCache:
+    """Test reuse of recent probe results."""
+
+    def test_available_server_is_cached(self, empty_probe_cache):
+        """Test a second probe within the TTL reuses the first result."""
+        detector = LocalLLMDetector()
+        available = server("available", ["model-a"])
+
+        assert probe(detector, available)[1] == 1
+        result, probes = probe(detector, available)
+
+        assert probes == 0
+        assert result == available
+
+    def test_cached_result_is_a_copy(self, empty_probe_cache):
+        """Test mutating a returned result doesn't change the cached one."""
+        detector = LocalLLMDetector()
+        available = server("available", ["model-a"])
+
+        first, _ = probe(detector, available)
+        first.models.append("mutated")
+        second, _ = probe(detector, available)
+
+        assert second.models == ["model-a"]
+        assert second is not first
+
+    @pytest.mark.parametrize("status", ["starting", "unreachable", "no_models"])
+    def test_unavailable_server_is_not_cached(self, empty_probe_cache, status):
+        """Test servers that aren't ready are probed again every time."""
+        detector = LocalLLMDetector()
+
+        probe(detector, server(status))
+
+        assert probe(detector, server(status))[1] == 1
+
+    def test_zero_ttl_disables_cache(self, empty_probe_cache):
+        """Test WHISPERENGINE_BACKEND_PROBE_TTL=0 probes every time."""
+        detector = LocalLLMDetector()
+        available = server("available", ["model-a"])
+
+        with patch.dict("os.environ", {"WHISPERENGINE_BACKEND_PROBE_TTL": "0"}):
+            probe(detector, available)
+            assert probe(detector, available)[1] == 1
+
+
+class TestGpuDetection:
+    """Test GPU detection runs once per process."""
+
+    def test_gpu_probe_runs_once(self):
+        """Test the GPU probe result is reused across detectors."""
+        with (
+            patch.object(detector_module, "_GPU_AVAILABLE", None),
+            patch.object(LocalLLMDetector, "_probe_gpu", return_value=True) as probe_gpu,
+        ):
+            assert LocalLLMDetector()._detect_gpu() is True
+            assert LocalLLMDetector()._detect_gpu() is True
+
+        assert probe_gpu.call_count == 1
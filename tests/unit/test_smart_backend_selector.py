@@ -0,0 +1,61 @@
+"""
+Unit tests for the smart backend selector.
+
+Covers cache invalidation on refresh() and the global selector instance.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+import src.llm.smart_backend_selector as selector_module
+from src.llm.smart_backend_selector import SmartBackendSelector, get_smart_backend_selector
+
+
+@pytest.fixture
+def openai_only():
+    """Configure only the OpenAI backend."""
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "test_key"}, clear=True):
+        yield
+
+
+class TestSmartBackendSelectorCaching:
+    """Test the selector's cached results and their invalidation."""
+
+    def test_refresh_invalidates_optimal_backend(self, openai_only):
+        """Test refresh() picks up a backend configured after the first selection."""
+        selector = SmartBackendSelector()
+        assert selector.get_optimal_backend().name == "OpenAI"
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test_key"}, clear=True):
+            assert selector.get_optimal_backend().name == "OpenAI"
+            selector.refresh()
+            assert selector.get_optimal_backend().name == "Anthropic"
+
+    def test_refresh_invalidates_backend_status(self, openai_only):
+        """Test refresh() recomputes the cached backend status."""
+        selector = SmartBackendSelector()
+        assert set(selector.get_backend_status()) == {"OpenAI"}
+
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test_key"}, clear=True):
+            assert set(selector.get_backend_status()) == {"OpenAI"}
+            selector.refresh()
+            assert set(selector.get_backend_status()) == {"Anthropic"}
+
+    def test_backend_status_returns_copies(self, openai_only):
+        """Test callers can't mutate the cached backend status."""
+        selector = SmartBackendSelector()
+        selector.get_backend_status()["OpenAI"]["configured"] = False
+
+        assert selector.get_backend_status()["OpenAI"]["configured"] is True
+
+
+class TestGlobalSmartBackendSelector:
+    """Test the global selector instance."""
+
+    def test_returns_the_same_instance(self, openai_only):
+        """Test repeated calls share one selector."""
+        with patch.object(selector_module, "_smart_backend_selector", None):
+            first = get_smart_backend_selector()
+            assert get_smart_backend_selector() is first
+            assert selector_module._smart_backend_selector is first
@@ -4,12 +4,9 @@ Comprehensive test suite for LLM Message Role Security Processing
 Tests the CVSS 7.4 vulnerability fix for LLM Message Role Processing
 """
 
-import os
 import sys
 
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from llm_message_role_security import (
+from src.security.llm_message_role_security import (
     LLMMessageRoleSecurityProcessor,
     secure_message_role_processing,
 )
@@ -4,11 +4,7 @@ Comprehensive Security Test for LLM Message Role Processing Fix
 Tests the P1 Critical vulnerability fix (CVSS 7.4)
 """
 
-import sys
-
-sys.path.append(".")
-
-from llm_message_role_security import (
+from src.security.llm_message_role_security import (
     secure_message_role_processing,
 )
 
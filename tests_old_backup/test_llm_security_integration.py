@@ -4,12 +4,8 @@ Integration test for LLM Message Role Security with LMStudioClient
 Tests the fix integrated into the actual bot components
 """
 
-import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 import asyncio
+import sys
 from unittest.mock import patch
 
 from lmstudio_client import LMStudioClient
@@ -61,7 +57,7 @@ def test_fallback_processing():
 
     # Mock the security module to fail
     with patch(
-        "llm_message_role_security.secure_message_role_processing",
+        "src.security.llm_message_role_security.secure_message_role_processing",
         side_effect=Exception("Security module failed"),
     ):
         # Should fall back to basic processing